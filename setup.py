@@ -1,6 +1,6 @@
 from setuptools import setup, find_packages
 
-requirements = ["requests>=2.22.0"]
+requirements = ["requests>=2.22.0", "orjson; python_version >= '3.7'"]
 
 setup_requirements = ["pytest-runner", "setuptools>=38.6.0", "wheel>=0.31.0"]
 
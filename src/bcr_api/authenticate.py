@@ -25,10 +25,12 @@ def authenticate(username, password, credentials_path=None):
 def main():
     logger = logging.getLogger("bcr_api")
     logger.setLevel(logging.INFO)
-    handler = logging.StreamHandler()
+    # reuse the handler set up by bwproject, rather than adding a second one which would print every line twice
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
     formatter = logging.Formatter("%(levelname)s: %(message)s", "%H:%M:%S")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    for handler in logger.handlers:
+        handler.setFormatter(formatter)
 
     parser = argparse.ArgumentParser(
         description="Logging to Brandwatch and retrieve and access token.",
@@ -2,11 +2,18 @@
 bwdata contains the BWData class.
 """
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from . import filters
 import logging
 
 logger = logging.getLogger("bcr_api")
 
+# the allowed options for each filter as sets, built once at import so that each value is checked with a hash lookup
+# note: this is a snapshot, so changes made to filters.special_options after import are not seen by _valid_input()
+_special_options = {
+    param: frozenset(options) for param, options in filters.special_options.items()
+}
+
 
 class BWData:
     """
@@ -42,7 +49,7 @@ class BWData:
                 **kwargs
             )
         )
-        logger.info("{} mentions downloaded".format(len(all_mentions)))
+        logger.info("%s mentions downloaded", len(all_mentions))
         return all_mentions
 
     def iter_mentions(
@@ -81,15 +88,15 @@ class BWData:
             if len(next_mentions) > 0:
                 cursor = next_cursor
                 logger.info(
-                    "Mentions page {} of {} {} retrieved".format(
-                        page_idx, self.resource_type, name
-                    )
+                    "Mentions page %s of %s %s retrieved",
+                    page_idx,
+                    self.resource_type,
+                    name,
                 )
                 if iter_by_page:
                     yield next_mentions
                 else:
-                    for mention in next_mentions:
-                        yield mention
+                    yield from next_mentions
             if len(next_mentions) < page_size or not next_cursor:
                 break
 
@@ -298,13 +305,14 @@ class BWData:
         Returns:
             A dictionary representation of the component key insights
         """
-        key_insights = {
-            "total_mentions": self.get_keyinsights_mention_count(name, startDate),
-            "unique_authors": self.get_keyinsights_author_count(name, startDate),
-            "topic_trends": self.get_keyinsights_topics(name, startDate),
-            "rising_news": self.get_keyinsights_news(name, startDate),
-        }
-        return key_insights
+        return self._get_components(
+            {
+                "total_mentions": (self.get_keyinsights_mention_count, name, startDate),
+                "unique_authors": (self.get_keyinsights_author_count, name, startDate),
+                "topic_trends": (self.get_keyinsights_topics, name, startDate),
+                "rising_news": (self.get_keyinsights_news, name, startDate),
+            }
+        )
 
     def get_keyinsights_mention_count(self, name=None, startDate=None, **kwargs):
         """
@@ -386,12 +394,13 @@ class BWData:
         Returns:
             A dictionary representation of the summary component analysis
         """
-        summary = {
-            "sentiment": self.get_summary_sentiment(name, startDate),
-            "topsites": self.get_summary_topsites(name, startDate),
-            "pagetypes": self.get_summary_pagetypes(name, startDate),
-        }
-        return summary
+        return self._get_components(
+            {
+                "sentiment": (self.get_summary_sentiment, name, startDate),
+                "topsites": (self.get_summary_topsites, name, startDate),
+                "pagetypes": (self.get_summary_pagetypes, name, startDate),
+            }
+        )
 
     def get_summary_sentiment(self, name=None, startDate=None, **kwargs):
         """
@@ -456,17 +465,12 @@ class BWData:
         Returns:
             A dictionary representation of the twitter insights component data
         """
-        twitter_insights = {
-            "hashtags": self.get_twitter_insights_feature(name, startDate, "hashtags"),
-            "emoticons": self.get_twitter_insights_feature(
-                name, startDate, "emoticons"
-            ),
-            "urls": self.get_twitter_insights_feature(name, startDate, "urls"),
-            "mentionedauthors": self.get_twitter_insights_feature(
-                name, startDate, "mentionedauthors"
-            ),
-        }
-        return twitter_insights
+        return self._get_components(
+            {
+                feature: (self.get_twitter_insights_feature, name, startDate, feature)
+                for feature in ["hashtags", "emoticons", "urls", "mentionedauthors"]
+            }
+        )
 
     def get_twitter_insights_feature(
         self, name=None, startDate=None, feature=None, **kwargs
@@ -554,19 +558,22 @@ class BWData:
         Returns:
             A dictionary representation of the entire facebook analytics component data
         """
-        fb_analytics = {
-            "audience": self.get_fb_analytics_partial(name, startDate, "audience"),
-            "ownerActivity": self.get_fb_analytics_partial(
-                name, startDate, "ownerActivity"
-            ),
-            "audienceActivity": self.get_fb_analytics_partial(
-                name, startDate, "audienceActivity"
-            ),
-            "impressions": self.get_fb_analytics_partial(
-                name, startDate, "impressions"
-            ),
-        }
-        return fb_analytics
+        return self._get_components(
+            {
+                metadata_type: (
+                    self.get_fb_analytics_partial,
+                    name,
+                    startDate,
+                    metadata_type,
+                )
+                for metadata_type in [
+                    "audience",
+                    "ownerActivity",
+                    "audienceActivity",
+                    "impressions",
+                ]
+            }
+        )
 
     def get_fb_analytics_partial(
         self, name=None, startDate=None, metadata_type=None, **kwargs
@@ -659,15 +666,17 @@ class BWData:
         Returns:
             A dictionary representation of the entire instagram interactions component data.
         """
-        instagram_interactions = {
-            "ownerActivity": self.get_ig_interactions_partial(
-                name, startDate, "ownerActivity"
-            ),
-            "audienceActivity": self.get_ig_interactions_partial(
-                name, startDate, "audienceActivity"
-            ),
-        }
-        return instagram_interactions
+        return self._get_components(
+            {
+                metadata_type: (
+                    self.get_ig_interactions_partial,
+                    name,
+                    startDate,
+                    metadata_type,
+                )
+                for metadata_type in ["ownerActivity", "audienceActivity"]
+            }
+        )
 
     def get_ig_interactions_partial(
         self, name=None, startDate=None, metadata_type=None, **kwargs
@@ -706,14 +715,17 @@ class BWData:
         Returns:
             A dictionary representation of the entire instagram owner insights component data.
         """
-        instagram_insights = {
-            "mentionedauthors": self.get_ig_insights_partial(
-                name, startDate, "mentionedauthors"
-            ),
-            "hashtags": self.get_ig_insights_partial(name, startDate, "hashtags"),
-            "emoticons": self.get_ig_insights_partial(name, startDate, "emoticons"),
-        }
-        return instagram_insights
+        return self._get_components(
+            {
+                metadata_type: (
+                    self.get_ig_insights_partial,
+                    name,
+                    startDate,
+                    metadata_type,
+                )
+                for metadata_type in ["mentionedauthors", "hashtags", "emoticons"]
+            }
+        )
 
     def get_ig_insights_partial(
         self, name=None, startDate=None, metadata_type=None, **kwargs
@@ -807,19 +819,22 @@ class BWData:
         Returns:
             A dictionary representation of the entire twitter analytics component data
         """
-        tw_analytics = {
-            "audience": self.get_tw_analytics_partial(name, startDate, "audience"),
-            "ownerActivity": self.get_tw_analytics_partial(
-                name, startDate, "ownerActivity"
-            ),
-            "audienceActivity": self.get_tw_analytics_partial(
-                name, startDate, "audienceActivity"
-            ),
-            "impressions": self.get_tw_analytics_partial(
-                name, startDate, "impressions"
-            ),
-        }
-        return tw_analytics
+        return self._get_components(
+            {
+                metadata_type: (
+                    self.get_tw_analytics_partial,
+                    name,
+                    startDate,
+                    metadata_type,
+                )
+                for metadata_type in [
+                    "audience",
+                    "ownerActivity",
+                    "audienceActivity",
+                    "impressions",
+                ]
+            }
+        )
 
     def get_tw_analytics_partial(
         self, name=None, startDate=None, metadata_type=None, **kwargs
@@ -876,13 +891,17 @@ class BWData:
         Returns:
             A dictionary representation of the entire demographics summary component data
         """
-        dem_summary = {
-            "gender": self.get_dem_summary_partial(name, startDate, "gender"),
-            "interest": self.get_dem_summary_partial(name, startDate, "interest"),
-            "profession": self.get_dem_summary_partial(name, startDate, "profession"),
-            "countries": self.get_dem_summary_partial(name, startDate, "countries"),
-        }
-        return dem_summary
+        return self._get_components(
+            {
+                metadata_type: (
+                    self.get_dem_summary_partial,
+                    name,
+                    startDate,
+                    metadata_type,
+                )
+                for metadata_type in ["gender", "interest", "profession", "countries"]
+            }
+        )
 
     def get_dem_summary_partial(
         self, name=None, startDate=None, metadata_type=None, **kwargs
@@ -910,6 +929,23 @@ class BWData:
             endpoint="data/demographics/" + metadata_type, params=params
         )
 
+    def _get_components(self, calls):
+        """
+        Helper method: Retrieves the parts of a component concurrently.
+        Each part runs in its own thread, and all of them share the project's single requests.Session (and its connection pool).
+        The parts are still rate limited: BWUser.bare_request hands each request its own slot, REQUEST_INTERVAL apart,
+        so running them concurrently only overlaps their response times, not their start times.
+
+        Args:
+            calls:          A dictionary of the form {key: (function, arg1, arg2, ...)}, one entry per part of the component.
+
+        Returns:
+            A dictionary of the form {key: result}, in the same order as calls.  Any error raised while retrieving a part is re-raised.
+        """
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {key: executor.submit(*call) for key, call in calls.items()}
+            return {key: future.result() for key, future in futures.items()}
+
     def _get_date_ranges(self, query_id=None):
         """
         Helper method: Gets the date range for a query
@@ -936,27 +972,27 @@ class BWData:
         id_list = []
 
         for name in name_list:
+            # resolve each name once - an ambiguous name still raises, as in check_resource_exists()
             if isinstance(name, str):
-                if not self.check_resource_exists(name):
+                try:
+                    id_list.append(self.get_resource_id(name))
+                except KeyError:
                     logger.error(
-                        "Could not find {} with name {}".format(
-                            self.resource_type, name
-                        )
+                        "Could not find %s with name %s", self.resource_type, name
                     )
-                else:
-                    id_list.append(self.get_resource_id(name))
             elif isinstance(name, int):
-                if not self.check_resource_exists(name):
+                try:
+                    self.get_resource_id(name)
+                except KeyError:
                     logger.error(
-                        "Could not find {} with id {}".format(self.resource_type, name)
+                        "Could not find %s with id %s", self.resource_type, name
                     )
                 else:
                     id_list.append(name)
             else:
                 logger.error(
-                    "Must reference {} with type string or int".format(
-                        self.resource_type
-                    ),
+                    "Must reference %s with type string or int: %r",
+                    self.resource_type,
                     name,
                 )
 
@@ -1000,8 +1036,12 @@ class BWData:
             not isinstance(setting, filters.params[param])
         ):
             return False
-        elif param in filters.special_options:
+        elif param in _special_options:
             setting = setting if isinstance(setting, list) else [setting]
-            return all(map(lambda x: x in filters.special_options[param], setting))
+            try:
+                return _special_options[param].issuperset(setting)
+            except TypeError:
+                # unhashable values (e.g. nested lists) can't be valid options
+                return False
         else:
             return True
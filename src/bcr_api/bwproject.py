@@ -2,19 +2,40 @@
 bwproject contains the BWUser and BWProject classes
 """
 
-import requests
 import time
 import logging
-import json
+import threading
 
+from . import jsonutils
 from .credentials import CredentialsStore
 
 logger = logging.getLogger("bcr_api")
-handler = logging.StreamHandler()
-formatter = logging.Formatter("%(asctime)s %(levelname)s: %(message)s", "%H:%M:%S")
-handler.setFormatter(formatter)
-logger.addHandler(handler)
-logger.setLevel(logging.DEBUG)
+# only configure the logger once, so that log lines aren't duplicated if this module is reloaded
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(asctime)s %(levelname)s: %(message)s", "%H:%M:%S")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+# minimum number of seconds between consecutive requests made by a BWUser, to stay within the API's rate limits
+# this holds across threads too, e.g. when the parts of a component are retrieved concurrently
+REQUEST_INTERVAL = 0.5
+
+
+def _create_session():
+    """Creates a requests Session whose connections are kept alive and pooled between API calls."""
+    # requests (and urllib3, ssl, etc.) is only imported once a session is needed, which keeps importing bcr_api fast
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class BWUser:
@@ -28,6 +49,7 @@ class BWUser:
         username:   Brandwatch username.
         password:   Brandwatch password.
         token:      Access token.
+        session:    requests Session used for every HTTP request, so that connections to the API are reused.  It is shared by the threads that BWData uses to retrieve the parts of a component concurrently.
     """
 
     def __init__(
@@ -51,6 +73,10 @@ class BWUser:
             token_path:  File path to the file where access tokens will be read from and written to - Optional.  Defaults to tokens.txt, pass None to disable.
         """
         self.apiurl = apiurl
+        self.session = _create_session()
+        self._last_request_time = None
+        self._request_lock = threading.Lock()
+        self._user_id = None
         self.oauthpath = "oauth/token"
         self.credentials_store = CredentialsStore(credentials_path=token_path)
         if token:
@@ -74,7 +100,7 @@ class BWUser:
 
         headers = {}
         headers["Authorization"] = "Bearer {}".format(token)
-        user = requests.get(self.apiurl + "me", headers=headers).json()
+        user = self.session.get(self.apiurl + "me", headers=headers).json()
 
         if "username" in user:
             if username is None:
@@ -91,7 +117,7 @@ class BWUser:
     def _get_auth(
         self, username, password, token_path, grant_type, client_id, client_secret
     ):
-        token = requests.post(
+        token = self.session.post(
             self.apiurl + self.oauthpath,
             params={
                 "username": username,
@@ -113,12 +139,18 @@ class BWUser:
         Returns:
             List of dictionaries, where each dictionary is the information (name, id, clientName, timezone, ....) for one project.
         """
-        response = self.request(verb=requests.get, address="projects")
+        response = self.request(verb=self.session.get, address="projects")
         return response["results"] if "results" in response else response
 
     def get_self(self):
         """Gets username and id"""
-        return self.request(verb=requests.get, address="me")
+        return self.request(verb=self.session.get, address="me")
+
+    def get_user_id(self):
+        """Gets the user's id.  This is only requested once, since it cannot change for a given user."""
+        if self._user_id is None:
+            self._user_id = self.get_self()["id"]
+        return self._user_id
 
     def validate_query_search(self, **kwargs):
         """
@@ -137,7 +169,9 @@ class BWUser:
             kwargs["language"] = ["en"]
 
         valid_search = self.request(
-            verb=requests.post, address="query-validation", data=json.dumps(kwargs)
+            verb=self.session.post,
+            address="query-validation",
+            data=jsonutils.dumps(kwargs),
         )
         return valid_search
 
@@ -158,7 +192,9 @@ class BWUser:
             kwargs["language"] = ["en"]
 
         valid_search = self.request(
-            verb=requests.get, address="query-validation/searchwithin", params=kwargs
+            verb=self.session.get,
+            address="query-validation/searchwithin",
+            params=kwargs,
         )
         return valid_search
 
@@ -167,7 +203,7 @@ class BWUser:
         Makes a request to the Brandwatch API.
 
         Args:
-            verb:       Type of request you want to make (e.g. 'requests.get').
+            verb:       Type of request you want to make (e.g. 'self.session.get').
             address:    Address to append to the Brandwatch API url.
             params:     Any additional parameters - Optional.
             data:       Any additional data - Optional.
@@ -191,7 +227,7 @@ class BWUser:
         Makes a request to the Brandwatch API.
 
         Args:
-            verb:           Type of request you want to make (e.g. 'requests.get').
+            verb:           Type of request you want to make (e.g. 'self.session.get').
             address_root:   In most cases this will the the Brandwatch API url, but we leave the flexibility to change this for a different root address if needed.
             address_suffix: Address to append to the root url.
             access_token:   Access token - Optional.
@@ -201,7 +237,17 @@ class BWUser:
         Returns:
             The response json
         """
-        time.sleep(0.5)
+        # reserve the next free slot under the lock, so that concurrent requests are still spaced out,
+        # then only wait out whatever is left until that slot rather than always sleeping
+        with self._request_lock:
+            now = time.monotonic()
+            if self._last_request_time is None:
+                next_allowed = now
+            else:
+                next_allowed = max(now, self._last_request_time + REQUEST_INTERVAL)
+            self._last_request_time = next_allowed
+        if next_allowed > now:
+            time.sleep(next_allowed - now)
 
         headers = {}
 
@@ -218,29 +264,31 @@ class BWUser:
             )
 
         try:
-            response.json()
-        except ValueError as e:
+            body = jsonutils.loads(response.content)
+        except jsonutils.JSONDecodeError as e:
             # handles non-json responses (e.g. HTTP 404, 500, 502, 503, 504)
-            if "Expecting value: line 1 column 1 (char 0)" in str(e):
+            if e.pos == 0:
                 logger.error(
-                    "There was an error with this request: \n{}\n{}\n{}".format(
-                        response.url, data, response.text
-                    )
+                    "There was an error with this request: \n%s\n%s\n%s",
+                    response.url,
+                    data,
+                    response.text,
                 )
                 raise RuntimeError(response.text)
             else:
                 raise
         else:
-            if "errors" in response.json() and response.json()["errors"]:
+            if "errors" in body and body["errors"]:
                 logger.error(
-                    "There was an error with this request: \n{}\n{}\n{}".format(
-                        response.url, data, response.json()["errors"]
-                    )
+                    "There was an error with this request: \n%s\n%s\n%s",
+                    response.url,
+                    data,
+                    body["errors"],
                 )
-                raise RuntimeError(response.json()["errors"])
+                raise RuntimeError(body["errors"])
 
         logger.debug(response.url)
-        return response.json()
+        return body
 
 
 class BWProject(BWUser):
@@ -301,7 +349,7 @@ class BWProject(BWUser):
         project_found = False
 
         try:
-            int(project)
+            project_id = int(project)
             numerical = True
         except ValueError:
             numerical = False
@@ -309,7 +357,7 @@ class BWProject(BWUser):
         for p in projects:
             found = False
             if numerical:
-                if p["id"] == int(project):
+                if p["id"] == project_id:
                     found = True
             else:
                 if p["name"] == project:
@@ -336,7 +384,9 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.get, address=self.project_address + endpoint, params=params
+            verb=self.session.get,
+            address=self.project_address + endpoint,
+            params=params,
         )
 
     def delete(self, endpoint, params={}):
@@ -351,7 +401,9 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.delete, address=self.project_address + endpoint, params=params
+            verb=self.session.delete,
+            address=self.project_address + endpoint,
+            params=params,
         )
 
     def post(self, endpoint, params={}, data={}):
@@ -367,7 +419,7 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.post,
+            verb=self.session.post,
             address=self.project_address + endpoint,
             params=params,
             data=data,
@@ -386,7 +438,7 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.put,
+            verb=self.session.put,
             address=self.project_address + endpoint,
             params=params,
             data=data,
@@ -405,7 +457,7 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.patch,
+            verb=self.session.patch,
             address=self.project_address + endpoint,
             params=params,
             data=data,
@@ -2,14 +2,26 @@
 bwresources contains the BWMentions, BWQueries, BWGroups, BWRules, BWTags, BWCategories, BWSiteLists, BWAuthorLists, BWLocationLists, and BWSignals classes.
 """
 
-import json
 from . import filters
 from . import bwdata
+from . import jsonutils
 import logging
 
 
 logger = logging.getLogger("bcr_api")
 
+# filter attributes grouped by the resource they refer to, built once so that _name_to_id() can dispatch with hash lookups
+_CATEGORY_ATTRIBUTES = frozenset(["category", "xcategory"])
+_PARENT_CATEGORY_ATTRIBUTES = frozenset(
+    ["parentCategory", "xparentCategory", "parentCategories", "categories"]
+)
+_TAG_ATTRIBUTES = frozenset(["tag", "xtag", "tags"])
+_AUTHOR_GROUP_ATTRIBUTES = frozenset(["authorGroup", "xauthorGroup"])
+_LOCATION_GROUP_ATTRIBUTES = frozenset(
+    ["locationGroup", "xlocationGroup", "authorLocationGroup", "xauthorLocationGroup"]
+)
+_SITE_GROUP_ATTRIBUTES = frozenset(["siteGroup", "xsiteGroup"])
+
 
 class AmbiguityError(ValueError):
     """Simple class to make errors when handling resource IDs more clear"""
@@ -36,6 +48,8 @@ class BWResource:
         self.project = bwproject
         self.names = {}
         self.raw_resources = {}
+        self._ids_by_name = {}
+        self._list_resources = {}
         self.reload()
 
     def reload(self):
@@ -54,63 +68,53 @@ class BWResource:
         if "results" not in response:
             raise KeyError("Could not retrieve" + self.resource_type, response)
 
-        self.raw_resources = {
-            resource["id"]: resource for resource in response["results"]
-        }
+        raw_resources = {}
+        names = {}
+        # index ids by name, so that names can be resolved (and ambiguous names detected) without a scan
+        ids_by_name = {}
+        for resource in response["results"]:
+            raw_resources[resource["id"]] = resource
+            names[resource["id"]] = resource["name"]
+            ids_by_name.setdefault(resource["name"], []).append(resource["id"])
 
-        self.names = {
-            resource["id"]: resource["name"] for resource in response["results"]
-        }
+        self.raw_resources = raw_resources
+        self.names = names
+        self._ids_by_name = ids_by_name
 
     def get_resource_id(self, resource=None):
         """Takes in a resource ID or name and returns the resource ID. Raises an error if an ambiguous name is provided (e.g. if user calls this function with 'Query1' and there is actually a query and a logo query with that name)"""
+        resource_id = self._find_resource_id(resource)
+        if resource_id is None:
+            raise KeyError(
+                "Could not find the resource {} {} in the project".format(
+                    "name" if isinstance(resource, str) else "ID", resource
+                )
+            )
+        return resource_id
+
+    def check_resource_exists(self, resource):
+        """Returns whether a resource ID or name is in the project.  Raises an AmbiguityError if an ambiguous name is provided."""
+        return self._find_resource_id(resource) is not None
+
+    def _find_resource_id(self, resource):
+        """internal use - resolves a resource ID or name to its ID, returning None rather than raising a KeyError if it isn't in the project"""
         if not resource:
             return ""  # return empty string rather than none to avoid stringified "None" becoming part of the url of an API call
-        if isinstance(resource, int):
-            if resource not in self.names.keys():
-                raise KeyError(
-                    "Could not find the resource ID {} in the project".format(resource)
-                )
-            resource_id = resource
-        elif isinstance(resource, str):
-            entries = [
-                resource_id
-                for resource_id, name in self.names.items()
-                if name == resource
-            ]
+        if isinstance(resource, str):
+            entries = self._ids_by_name.get(resource, [])
             if len(entries) > 1:
                 raise AmbiguityError(
                     "The resource name {} is ambiguous: {}".format(resource, entries)
                 )
             if entries:
                 return entries[0]
-            else:
-                try:
-                    resource_id = int(resource)
-                except ValueError:
-                    raise KeyError(
-                        "Could not find the resource name {} in the project".format(
-                            resource
-                        )
-                    )
-        if resource_id not in self.names.keys():
-            raise KeyError(
-                "Could not find the resource ID {} in the project".format(resource)
-            )
-        if resource_id:
-            return resource_id
-
-    def check_resource_exists(self, resource):
-        try:
-            self.get_resource_id(resource)
-            return True
-        # Check the type of error
-        # Key errors relate to the resource not being present, if KeyError return False, because the resource doesn't exist
-        # If there's a ValueError, we want that still to be raised, because it means the resource name is ambiguous, and we want to raise that
-        except AmbiguityError:
-            raise
-        except KeyError:
-            return False
+            try:
+                resource = int(resource)
+            except ValueError:
+                return None
+        if isinstance(resource, int) and resource in self.names:
+            return resource
+        return None
 
     def get(self, name=None):
         """
@@ -163,23 +167,22 @@ class BWResource:
             # eventually make _fill_data() a BWResource func
             filled_data = self._fill_data(data)
             name = data["name"]
+            exists = self.check_resource_exists(name)
 
-            if self.check_resource_exists(name) and not create_only:
+            if exists and not create_only:
                 resource_id = self.get_resource_id(name)
                 response = self.project.put(
                     endpoint=self.specific_endpoint + "/" + str(resource_id),
                     data=filled_data,
                 )
-            elif (
-                not self.check_resource_exists(name) and not modify_only
-            ):  # if resource does not exist
+            elif not exists and not modify_only:
                 response = self.project.post(
                     endpoint=self.specific_endpoint, data=filled_data
                 )
             else:
                 continue
 
-            logger.info("Uploading {} {}".format(self.resource_type, response["name"]))
+            logger.info("Uploading %s %s", self.resource_type, response["name"])
             resources[response["name"]] = response["id"]
 
         self.reload()
@@ -231,7 +234,7 @@ class BWResource:
                     endpoint=self.specific_endpoint + "/" + str(resource_id)
                 )
                 logger.info(
-                    "{} {} deleted".format(self.resource_type, self.names[resource_id])
+                    "%s %s deleted", self.resource_type, self.names[resource_id]
                 )
 
         self.reload()
@@ -239,6 +242,28 @@ class BWResource:
     def _fill_data():
         raise NotImplementedError
 
+    def _get_list_resource(self, resource_class):
+        """internal use - author, site and location lists are loaded on first use and then reused, to prevent repetitive API calls"""
+        if resource_class not in self._list_resources:
+            self._list_resources[resource_class] = resource_class(self.project)
+        return self._list_resources[resource_class]
+
+    def _get_list_resource_id(self, resource_class, name):
+        """internal use - resolves an author, site or location list to its ID, reloading the cached lists once if it isn't found (e.g. if the list was created after they were loaded)"""
+        lists = self._get_list_resource(resource_class)
+        if not lists.check_resource_exists(name):
+            lists.reload()
+        return lists.get_resource_id(name)
+
+    def _get_list_resource_name(self, resource_class, ids):
+        """internal use - resolves author, site or location list IDs to the name of the first one found, reloading the cached lists once if none of them are found"""
+        lists = self._get_list_resource(resource_class)
+        if not any(resource_id in lists.names for resource_id in ids):
+            lists.reload()
+        for resource_id, resource_name in lists.names.items():
+            if resource_id in ids:
+                return resource_name
+
     def _fill_subrule_data(self, data):
         filled = {}
         filled["filter"] = data["filter"] if ("filter" in data) else {}
@@ -288,6 +313,7 @@ class BWQueries(BWResource, bwdata.BWData):
             languages: Optional, pass in no arguments to make the query language agnostic
             samplePercentage: Optional, defaults to 100 (percent)
             query_type: Optional, defaults to 'monitor'
+            validate_search: Optional, defaults to True.  Pass False to skip checking booleanQuery with the query validation endpoint, e.g. for searches that are already known to be valid
 
         Raises:
             KeyError: If you do not pass name and booleanQuery for each query in the data_list.
@@ -310,6 +336,7 @@ class BWQueries(BWResource, bwdata.BWData):
             languages: Optional, pass in no arguments to make the query language agnostic
             samplePercentage: Optional, defaults to 100 (percent)
             query_type: Optional, defaults to 'monitor'
+            validate_search: Optional, defaults to True.  Pass False to skip checking booleanQuery with the query validation endpoint, e.g. for searches that are already known to be valid
 
         Raises:
             KeyError: If you do not pass name and booleanQuery for each query in the data_list.
@@ -384,7 +411,7 @@ class BWQueries(BWResource, bwdata.BWData):
             except ValueError:
                 pass
 
-        if attribute in ["category", "xcategory"]:
+        if attribute in _CATEGORY_ATTRIBUTES:
             # setting is a dictionary with one key-value pair, so this loop iterates only once
             # but is necessary to extract the values in the dictionary
             ids = []
@@ -395,12 +422,7 @@ class BWQueries(BWResource, bwdata.BWData):
                     ids.append(self.categories.ids[parent]["children"][child])
             return ids
 
-        elif attribute in [
-            "parentCategory",
-            "xparentCategory",
-            "parentCategories",
-            "categories",
-        ]:
+        elif attribute in _PARENT_CATEGORY_ATTRIBUTES:
             # plural included for get_charts syntax
             # note: parentCategories and categories params will be ignored for everything but chart calls
             if not isinstance(setting, list):
@@ -410,7 +432,7 @@ class BWQueries(BWResource, bwdata.BWData):
                 ids.append(self.categories.ids[s]["id"])
             return ids
 
-        elif attribute in ["tag", "xtag", "tags"]:
+        elif attribute in _TAG_ATTRIBUTES:
             # plural included for get_charts syntax
             if not isinstance(setting, list):
                 setting = [setting]
@@ -419,36 +441,28 @@ class BWQueries(BWResource, bwdata.BWData):
                 ids.append(self.tags.get_resource_id(s))
             return ids
 
-        elif attribute in ["authorGroup", "xauthorGroup"]:
-            authorlists = BWAuthorLists(self.project)
+        elif attribute in _AUTHOR_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(authorlists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWAuthorLists, s))
             return ids
 
-        elif attribute in [
-            "locationGroup",
-            "xlocationGroup",
-            "authorLocationGroup",
-            "xauthorLocationGroup",
-        ]:
-            locationlists = BWLocationLists(self.project)
+        elif attribute in _LOCATION_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(locationlists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWLocationLists, s))
             return ids
 
-        elif attribute in ["siteGroup", "xsiteGroup"]:
-            sitelists = BWSiteLists(self.project)
+        elif attribute in _SITE_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(sitelists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWSiteLists, s))
             return ids
 
         else:
@@ -503,11 +517,12 @@ class BWQueries(BWResource, bwdata.BWData):
         if "startDate" in data:
             filled["startDate"] = data["startDate"]
 
-        # validating the query search - comment this out to skip validation
-        self.project.validate_query_search(
-            booleanQuery=filled["booleanQuery"], language=["en"]
-        )
-        return json.dumps(filled)
+        # validating the query search - pass validate_search=False to skip validation
+        if data.get("validate_search", True):
+            self.project.validate_query_search(
+                booleanQuery=filled["booleanQuery"], language=["en"]
+            )
+        return jsonutils.dumps(filled)
 
     def _fill_mention_params(self, data):
         if "name" not in data:
@@ -609,8 +624,11 @@ class BWGroups(BWResource, bwdata.BWData):
             name:   Name of the group that you'd like to delete.
         """
         # No need to delete the group itself, since a group will be deleted automatically when empty
-        BWQueries(self.project).delete_all(self.get_group_queries(name))
-        logger.info("Group {} deleted".format(name))
+        group_queries = self.get_group_queries(name)
+        # the group may have gained queries since self.queries was loaded (e.g. in the UI), so refresh it first
+        self.queries.reload()
+        self.queries.delete_all(group_queries)
+        logger.info("Group %s deleted", name)
 
     def get_group_queries(self, name):
         """
@@ -634,7 +652,7 @@ class BWGroups(BWResource, bwdata.BWData):
             except ValueError:
                 pass
 
-        if attribute in ["category", "xcategory"]:
+        if attribute in _CATEGORY_ATTRIBUTES:
             # setting is a dictionary with one key-value pair, so this loop iterates only once
             # but is necessary to extract the values in the dictionary
             ids = []
@@ -645,12 +663,7 @@ class BWGroups(BWResource, bwdata.BWData):
                     ids.append(self.categories.ids[parent]["children"][child])
             return ids
 
-        elif attribute in [
-            "parentCategory",
-            "xparentCategory",
-            "parentCategories",
-            "categories",
-        ]:
+        elif attribute in _PARENT_CATEGORY_ATTRIBUTES:
             # plural included for get_charts syntax
             # note: parentCategories and categories params will be ignored for everything but chart calls
             if not isinstance(setting, list):
@@ -660,7 +673,7 @@ class BWGroups(BWResource, bwdata.BWData):
                 ids.append(self.categories.ids[s]["id"])
             return ids
 
-        elif attribute in ["tag", "xtag", "tags"]:
+        elif attribute in _TAG_ATTRIBUTES:
             # plural included for get_charts syntax
             if not isinstance(setting, list):
                 setting = [setting]
@@ -669,36 +682,28 @@ class BWGroups(BWResource, bwdata.BWData):
                 ids.append(self.tags.get_resource_id(s))
             return ids
 
-        elif attribute in ["authorGroup", "xauthorGroup"]:
-            authorlists = BWAuthorLists(self.project)
+        elif attribute in _AUTHOR_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(authorlists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWAuthorLists, s))
             return ids
 
-        elif attribute in [
-            "locationGroup",
-            "xlocationGroup",
-            "authorLocationGroup",
-            "xauthorLocationGroup",
-        ]:
-            locationlists = BWLocationLists(self.project)
+        elif attribute in _LOCATION_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(locationlists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWLocationLists, s))
             return ids
 
-        elif attribute in ["siteGroup", "xsiteGroup"]:
-            sitelists = BWSiteLists(self.project)
+        elif attribute in _SITE_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(sitelists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWSiteLists, s))
             return ids
 
         else:
@@ -733,11 +738,9 @@ class BWGroups(BWResource, bwdata.BWData):
             else [self.project.project_id]
         )
         filled["users"] = (
-            data["users"]
-            if "users" in data
-            else [{"id": self.project.get_self()["id"]}]
+            data["users"] if "users" in data else [{"id": self.project.get_user_id()}]
         )
-        return json.dumps(filled)
+        return jsonutils.dumps(filled)
 
 
 class BWMentions:
@@ -783,33 +786,49 @@ class BWMentions:
                 parent = category
                 children = setting[category]
 
-            self.categories.upload(name=parent, children=children)
+            # only upload (and reload) the categories if some of them are new
+            if parent not in self.categories.ids or any(
+                child not in self.categories.ids[parent]["children"]
+                for child in children
+            ):
+                self.categories.upload(name=parent, children=children)
             setting = []
             for child in children:
                 setting.append(self.categories.ids[parent]["children"][child])
 
         elif action in ["addTag", "removeTag"]:
-            for s in setting:
-                self.tags.upload(name=s, create_only=True)
+            # upload any new tags together, so the tags are only reloaded once
+            # (deduplicated in order, as nothing is reloaded between the existence checks)
+            new_tags = [
+                s
+                for s in dict.fromkeys(setting)
+                if not self.tags.check_resource_exists(s)
+            ]
+            if new_tags:
+                self.tags.upload_all([{"name": s} for s in new_tags], create_only=True)
 
-        filled_data = []
-        for mention in mentions:
-            if action in filters.mutable and self._valid_patch_input(action, setting):
-                filled_data.append(
-                    self._fill_mention_data(
-                        mention=mention, action=action, setting=setting
-                    )
-                )
-            else:
-                raise KeyError("invalid action or setting", action, setting)
+        # the action and setting are shared by every mention, so check them once
+        if action not in filters.mutable or not self._valid_patch_input(
+            action, setting
+        ):
+            raise KeyError("invalid action or setting", action, setting)
+
+        filled_data = [
+            {
+                "queryId": mention["queryId"],
+                "resourceId": mention["resourceId"],
+                action: setting,
+            }
+            for mention in mentions
+        ]
         response = self.project.patch(
-            endpoint="data/mentions", data=json.dumps(filled_data)
+            endpoint="data/mentions", data=jsonutils.dumps(filled_data)
         )
 
         if "errors" in response:
             raise KeyError("patch failed", response)
 
-        logger.info("{} mentions updated".format(len(response)))
+        logger.info("%s mentions updated", len(response))
 
     def _valid_patch_input(self, action, setting):
         """internal use"""
@@ -823,21 +842,6 @@ class BWMentions:
         else:
             return True
 
-    def _fill_mention_data(self, **data):
-        """internal use"""
-        # pass in mention, filter_type, setting
-        filled = {}
-
-        filled["queryId"] = data["mention"]["queryId"]
-        filled["resourceId"] = data["mention"]["resourceId"]
-
-        if data["action"] in filters.mutable:
-            filled[data["action"]] = data["setting"]
-        else:
-            raise KeyError("not a mutable field", data["action"])
-
-        return filled
-
 
 class BWAuthorLists(BWResource):
     """
@@ -887,8 +891,8 @@ class BWAuthorLists(BWResource):
         )
 
         filled["userName"] = self.project.username
-        filled["userId"] = self.project.get_self()["id"]
-        return json.dumps(filled)
+        filled["userId"] = self.project.get_user_id()
+        return jsonutils.dumps(filled)
 
 
 class BWSiteLists(BWResource):
@@ -940,8 +944,8 @@ class BWSiteLists(BWResource):
         )
 
         filled["userName"] = self.project.username
-        filled["userId"] = self.project.get_self()["id"]
-        return json.dumps(filled)
+        filled["userId"] = self.project.get_user_id()
+        return jsonutils.dumps(filled)
 
 
 class BWLocationLists(BWResource):
@@ -992,8 +996,8 @@ class BWLocationLists(BWResource):
         )
 
         filled["userName"] = self.project.username
-        filled["userId"] = self.project.get_self()["id"]
-        return json.dumps(filled)
+        filled["userId"] = self.project.get_user_id()
+        return jsonutils.dumps(filled)
 
 
 class BWTags(BWResource):
@@ -1027,7 +1031,7 @@ class BWTags(BWResource):
                 rules.append(self._fill_subrule_data(rule))
             filled["rules"] = rules
 
-        return json.dumps(filled)
+        return jsonutils.dumps(filled)
 
 
 class BWCategories:
@@ -1071,18 +1075,16 @@ class BWCategories:
 
         else:
             self.ids = {}
+            self.raw_resources = {}
             for cat in response["results"]:
-                children = {}
-                for child in cat["children"]:
-                    children[child["name"]] = child["id"]
                 self.ids[cat["name"]] = {
                     "id": cat["id"],
                     "multiple": cat["multiple"],
-                    "children": children,
+                    "children": {
+                        child["name"]: child["id"] for child in cat["children"]
+                    },
                 }
-            self.raw_resources = {
-                resource["id"]: resource for resource in response["results"]
-            }
+                self.raw_resources[cat["id"]] = cat
 
     def upload(
         self, create_only=False, modify_only=False, overwrite_children=False, **kwargs
@@ -1134,18 +1136,18 @@ class BWCategories:
 
             if name in self.ids and not create_only:
 
-                new_children = []
-                existing_children = list(self.ids[name]["children"])
-                for child in data["children"]:
-                    if child not in existing_children:
-                        new_children.append(child)
+                existing_children = self.ids[name]["children"]
+                new_children = [
+                    child
+                    for child in data["children"]
+                    if child not in existing_children
+                ]
 
                 if new_children or overwrite_children:
                     if not overwrite_children:
                         # add the new children to the existing children
-                        for child in self.ids[name]["children"]:
-                            # don't append or else the data object will be affected outside of this function
-                            data["children"] = data["children"] + [child]
+                        # don't extend or else the data object will be affected outside of this function
+                        data["children"] = data["children"] + list(existing_children)
 
                     filled_data = self._fill_data(data)
                     self.project.put(
@@ -1228,17 +1230,17 @@ class BWCategories:
                         data["children"] = existing_children + data["children"]
                     self.project.put(
                         endpoint="rulecategories/" + str(self.ids[name]["id"]),
-                        data=json.dumps(data),
+                        data=jsonutils.dumps(data),
                     )
                 elif "new_name" in data:
                     self.project.put(
                         endpoint="rulecategories/" + str(self.ids[name]["id"]),
-                        data=json.dumps(data),
+                        data=jsonutils.dumps(data),
                     )
                     name = data["new_name"]
 
             elif name not in self.ids and not modify_only:
-                self.project.post(endpoint="rulecategories", data=json.dumps(data))
+                self.project.post(endpoint="rulecategories", data=jsonutils.dumps(data))
             else:
                 continue
 
@@ -1312,12 +1314,12 @@ class BWCategories:
             elif isinstance(item, dict):
                 if item["name"] in self.ids:
                     name = item["name"]
-                    updated_children = []
-                    existing_children = list(self.ids[name]["children"])
-
-                    for child in existing_children:
-                        if child not in item["children"]:
-                            updated_children.append(child)
+                    children_to_delete = set(item["children"])
+                    updated_children = [
+                        child
+                        for child in self.ids[name]["children"]
+                        if child not in children_to_delete
+                    ]
 
                     data = {
                         "name": name,
@@ -1334,8 +1336,7 @@ class BWCategories:
 
     def clear_all_in_project(self):
         """WARNING: This is the nuclear option.  Do not use lightly.  It deletes ALL categories in the project."""
-        for cat in self.ids:
-            self.delete(self.ids[cat]["id"])
+        self.delete_all(list(self.ids))
 
     def _fill_data(self, data):
         """internal use"""
@@ -1363,7 +1364,7 @@ class BWCategories:
             else:
                 child_id = None
             filled["children"].append({"name": child, "id": child_id})
-        return json.dumps(filled)
+        return jsonutils.dumps(filled)
 
 
 class BWRules(BWResource):
@@ -1636,7 +1637,7 @@ class BWRules(BWResource):
         else:
             filled["scope"] = "project"
 
-        return json.dumps(filled)
+        return jsonutils.dumps(filled)
 
     def _name_to_id(self, attribute, setting):
         if isinstance(setting, int):
@@ -1648,7 +1649,7 @@ class BWRules(BWResource):
             except ValueError:
                 pass
 
-        elif attribute in ["category", "xcategory"]:
+        elif attribute in _CATEGORY_ATTRIBUTES:
             # setting is a dictionary with one key-value pair, so this loop iterates only once
             # but is necessary to extract the values in the dictionary
             for category in setting:
@@ -1656,12 +1657,7 @@ class BWRules(BWResource):
                 child = setting[category][0]
             return self.categories.ids[parent]["children"][child]
 
-        elif attribute in [
-            "parentCategory",
-            "xparentCategory",
-            "parentCategories",
-            "categories",
-        ]:
+        elif attribute in _PARENT_CATEGORY_ATTRIBUTES:
             # plural included for get_charts syntax
             if not isinstance(setting, list):
                 setting = [setting]
@@ -1670,7 +1666,7 @@ class BWRules(BWResource):
                 ids.append(self.categories.ids[s]["id"])
             return ids
 
-        elif attribute in ["tag", "xtag", "tags"]:
+        elif attribute in _TAG_ATTRIBUTES:
             # plural included for get_charts syntax
             if not isinstance(setting, list):
                 setting = [setting]
@@ -1679,36 +1675,28 @@ class BWRules(BWResource):
                 ids.append(self.tags.get_resource_id(s))
             return ids
 
-        elif attribute in ["authorGroup", "xauthorGroup"]:
-            authorlists = BWAuthorLists(self.project)
+        elif attribute in _AUTHOR_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(authorlists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWAuthorLists, s))
             return ids
 
-        elif attribute in [
-            "locationGroup",
-            "xlocationGroup",
-            "authorLocationGroup",
-            "xauthorLocationGroup",
-        ]:
-            locationlists = BWLocationLists(self.project)
+        elif attribute in _LOCATION_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(locationlists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWLocationLists, s))
             return ids
 
-        elif attribute in ["siteGroup", "xsiteGroup"]:
-            sitelists = BWSiteLists(self.project)
+        elif attribute in _SITE_GROUP_ATTRIBUTES:
             if not isinstance(setting, list):
                 setting = [setting]
             ids = []
             for s in setting:
-                ids.append(sitelists.get(s)["id"])
+                ids.append(self._get_list_resource_id(BWSiteLists, s))
             return ids
 
         else:
@@ -1742,19 +1730,17 @@ class BWRules(BWResource):
             "addCategories",
             "removeCategories",
         ]:
+            setting = set(setting)
             names = {}
-            subcats = []
 
-            for category in self.categories.ids:
-                for subcategory in self.categories.ids[category]["children"]:
-                    if (
-                        self.categories.ids[category]["children"][subcategory]
-                        in setting
-                    ):
-                        subcats.append(subcategory)
+            for category, info in self.categories.ids.items():
+                subcats = [
+                    subcategory
+                    for subcategory, subcategory_id in info["children"].items()
+                    if subcategory_id in setting
+                ]
                 if subcats:
                     names[category] = subcats
-                subcats = []
 
             return names
 
@@ -1765,32 +1751,16 @@ class BWRules(BWResource):
                         return category
 
         elif attribute == "authorGroup" or attribute == "xauthorGroup":
-            resource_obj = BWAuthorLists(self.project)
-            for resource_id, resource_name in resource_obj.names.items():
-                for aulist in setting:
-                    if resource_id == aulist:
-                        return resource_name
+            return self._get_list_resource_name(BWAuthorLists, setting)
 
         elif attribute == "locationGroup" or attribute == "xlocationGroup":
-            resource_obj = BWLocationLists(self.project)
-            for resource_id, resource_name in resource_obj.names.items():
-                for aulist in setting:
-                    if resource_id == aulist:
-                        return resource_name
+            return self._get_list_resource_name(BWLocationLists, setting)
 
         elif attribute == "authorLocationGroup" or attribute == "xauthorLocationGroup":
-            resource_obj = BWLocationLists(self.project)
-            for resource_id, resource_name in resource_obj.names.items():
-                for aulist in setting:
-                    if resource_id == aulist:
-                        return resource_name
+            return self._get_list_resource_name(BWLocationLists, setting)
 
         elif attribute == "siteGroup" or attribute == "xsiteGroup":
-            resource_obj = BWSiteLists(self.project)
-            for resource_id, resource_name in resource_obj.names.items():
-                for aulist in setting:
-                    if resource_id == aulist:
-                        return resource_name
+            return self._get_list_resource_name(BWSiteLists, setting)
 
         else:
             return setting
@@ -1885,7 +1855,7 @@ class BWSignals(BWResource):
         for param in data:
             filled.update(self._name_to_id(param, data[param]))
 
-        return json.dumps(filled)
+        return jsonutils.dumps(filled)
 
     def _name_to_id(self, attribute, setting):
         """internal use"""
@@ -1901,7 +1871,7 @@ class BWSignals(BWResource):
                     )
             return {attribute: setting}
 
-        elif attribute in ["category", "xcategory"]:
+        elif attribute in _CATEGORY_ATTRIBUTES:
             for category in setting:
                 if isinstance(category, int):
                     # already in ID form
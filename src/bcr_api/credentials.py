@@ -59,8 +59,7 @@ class CredentialsStore:
 
     def __iter__(self):
         """Implement iter(self)."""
-        credentials = self._read()
-        yield from credentials.items()
+        return iter(self._read().items())
 
     def __len__(self):
         return len(self._read())
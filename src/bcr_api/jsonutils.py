@@ -0,0 +1,40 @@
+"""
+jsonutils contains the JSON helpers used for request and response bodies, which use orjson when it is installed.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is unavailable on older Pythons
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj):
+    """
+    Serializes obj to JSON for use as a request body.
+
+    Returns:
+        bytes when orjson is installed, otherwise a str.  Both can be passed straight through to requests as data.
+        Non-string dict keys (e.g. integer ids) are stringified, as they are by json.dumps.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj)
+
+
+def loads(data):
+    """
+    Deserializes a JSON response body.
+
+    Args:
+        data:   The raw body, as bytes (e.g. response.content).
+
+    Raises:
+        JSONDecodeError:    If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
@@ -0,0 +1,56 @@
+import threading
+import unittest
+
+from bcr_api.bwresources import BWQueries
+from test.test_id_name_map import StubBWProject
+
+
+class TestBWDataGetComponents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.queries = BWQueries(StubBWProject())
+
+    def test_results_keyed_in_call_order(self):
+        second_done = threading.Event()
+
+        def first(name):
+            # only finishes once the later part has, so completion order differs from call order
+            second_done.wait(1)
+            return "first " + name
+
+        def second(name):
+            second_done.set()
+            return "second " + name
+
+        results = self.queries._get_components(
+            {"b": (first, "My Query"), "a": (second, "My Query")}
+        )
+
+        self.assertEqual(list(results), ["b", "a"])
+        self.assertEqual(results, {"b": "first My Query", "a": "second My Query"})
+
+    def test_positional_args_forwarded(self):
+        def part(name, startDate, feature):
+            return (name, startDate, feature)
+
+        results = self.queries._get_components(
+            {"volume": (part, "My Query", "2019-01-01", "volume")}
+        )
+
+        self.assertEqual(results, {"volume": ("My Query", "2019-01-01", "volume")})
+
+    def test_part_error_raised(self):
+        def ok(name):
+            return name
+
+        def fails(name):
+            raise KeyError("Mentions GET request failed", name)
+
+        with self.assertRaises(KeyError):
+            self.queries._get_components(
+                {"ok": (ok, "My Query"), "fails": (fails, "My Query")}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
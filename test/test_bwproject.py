@@ -2,8 +2,11 @@ import unittest
 import responses
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from bcr_api.bwproject import BWProject
+from bcr_api.bwproject import BWProject, BWUser, REQUEST_INTERVAL
 
 
 class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
@@ -22,10 +25,9 @@ class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
             "billableClientIsPitch": False,
         }
     ]
+    USERNAMES = ["example@example.com", "EXAMPLE@EXAMPLE.COM", "eXaMpLe@ExAmPlE.cOm"]
 
     def setUp(self):
-        self.token_path = tempfile.NamedTemporaryFile(suffix="-tokens.txt").name
-
         responses.add(
             responses.GET,
             "https://api.brandwatch.com/projects",
@@ -46,24 +48,23 @@ class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
         )
 
     def tearDown(self):
-        os.unlink(self.token_path)
         responses.reset()
 
     @responses.activate
-    def test_lowercase_username(self):
-        self._test_username("example@example.com")
-
-    @responses.activate
-    def test_uppercase_username(self):
-        self._test_username("EXAMPLE@EXAMPLE.COM")
-
-    @responses.activate
-    def test_mixedcase_username(self):
-        self._test_username("eXaMpLe@ExAmPlE.cOm")
-
-    def _test_username(self, username):
-
-        responses.add(
+    def test_username_case(self):
+        for username in self.USERNAMES:
+            with self.subTest(username=username):
+                # each case gets its own token file, so it has to store its token rather than reading an earlier case's
+                token_path = tempfile.NamedTemporaryFile(suffix="-tokens.txt").name
+                try:
+                    self._test_username(username, token_path)
+                finally:
+                    if os.path.exists(token_path):
+                        os.unlink(token_path)
+
+    def _test_username(self, username, token_path):
+
+        responses.upsert(
             responses.GET,
             "https://api.brandwatch.com/me",
             json={"username": username},
@@ -74,15 +75,96 @@ class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
             username=username,
             project=self.PROJECT_NAME,
             password="",
-            token_path=self.token_path,
+            token_path=token_path,
         )
         try:
             BWProject(
-                username=username, project=self.PROJECT_NAME, token_path=self.token_path
+                username=username, project=self.PROJECT_NAME, token_path=token_path
             )
         except KeyError as e:
             self.fail(e)
 
 
+class TestBWUserRequestInterval(unittest.TestCase):
+
+    USERNAME = "example@example.com"
+    ACCESS_TOKEN = "00000000-0000-0000-0000-000000000000"
+
+    def setUp(self):
+        self.token_path = tempfile.NamedTemporaryFile(suffix="-tokens.txt").name
+
+        responses.add(
+            responses.GET,
+            "https://api.brandwatch.com/me",
+            json={"username": self.USERNAME},
+            status=200,
+        )
+
+    def tearDown(self):
+        os.unlink(self.token_path)
+        responses.reset()
+
+    @responses.activate
+    def test_only_waits_for_remaining_interval(self):
+        user = BWUser(token=self.ACCESS_TOKEN, token_path=self.token_path)
+        clock = FakeClock(100.0)
+
+        with mock.patch("bcr_api.bwproject.time", clock):
+            user.bare_request(user.session.get, user.apiurl, "me", self.ACCESS_TOKEN)
+            clock.now += 0.2
+            user.bare_request(user.session.get, user.apiurl, "me", self.ACCESS_TOKEN)
+            clock.now += 5.0
+            user.bare_request(user.session.get, user.apiurl, "me", self.ACCESS_TOKEN)
+
+        # the first request doesn't wait, the second waits out the rest of the interval, the third was already late enough
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], REQUEST_INTERVAL - 0.2)
+
+    @responses.activate
+    def test_concurrent_requests_are_spaced_out(self):
+        user = BWUser(token=self.ACCESS_TOKEN, token_path=self.token_path)
+        # the clock is frozen, so each request's slot is the start time plus however long it was told to sleep
+        clock = FakeClock(100.0, advance=False)
+        verb = mock.Mock(return_value=mock.Mock(content=b"{}"))
+
+        with mock.patch("bcr_api.bwproject.time", clock):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(
+                        user.bare_request, verb, user.apiurl, "me", self.ACCESS_TOKEN
+                    )
+                    for _ in range(4)
+                ]
+                for future in futures:
+                    future.result()
+
+        self.assertEqual(verb.call_count, 4)
+        slots = sorted(
+            [100.0] * (4 - len(clock.sleeps)) + [100.0 + s for s in clock.sleeps]
+        )
+        # each request is given its own slot, REQUEST_INTERVAL after the previous one
+        for i, slot in enumerate(slots):
+            self.assertAlmostEqual(slot, 100.0 + i * REQUEST_INTERVAL)
+
+
+class FakeClock:
+    """Stands in for the time module, where sleeping is recorded (and by default advances the clock) rather than blocking"""
+
+    def __init__(self, now, advance=True):
+        self.now = now
+        self.advance = advance
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            if self.advance:
+                self.now += seconds
+
+
 if __name__ == "__main__":
     unittest.main()
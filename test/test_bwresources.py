@@ -0,0 +1,146 @@
+import json
+import unittest
+
+from bcr_api.bwresources import (
+    BWCategories,
+    BWGroups,
+    BWMentions,
+    BWQueries,
+    BWRules,
+)
+from test.test_id_name_map import StubBWProject, query_id
+
+
+class RecordingStubBWProject(StubBWProject):
+    """Stub equivalent of BWProject which also accepts writes, recording every request made so that tests can check them"""
+
+    def __init__(self, *args, **kwargs):
+        super(RecordingStubBWProject, self).__init__(*args, **kwargs)
+        self.requests = []
+
+    def get(self, endpoint, params={}):
+        self.requests.append(("GET", endpoint))
+        if endpoint in self.examples:
+            return self.examples[endpoint]
+        return super(RecordingStubBWProject, self).get(endpoint, params)
+
+    def post(self, endpoint, params={}, data={}):
+        self.requests.append(("POST", endpoint))
+        return {"id": len(self.requests), "name": json.loads(data)["name"]}
+
+    def patch(self, endpoint, params={}, data={}):
+        self.requests.append(("PATCH", endpoint))
+        return json.loads(data)
+
+    def delete(self, endpoint, params={}):
+        self.requests.append(("DELETE", endpoint))
+        return {}
+
+
+class TestBWMentionsPatch(unittest.TestCase):
+    def test_repeated_new_tag_uploaded_once(self):
+        project = RecordingStubBWProject()
+        mentions = BWMentions(project)
+        project.requests.clear()
+
+        mentions.patch_mentions(
+            [{"queryId": 1, "resourceId": 2}], "addTag", ["new", "new"]
+        )
+
+        self.assertEqual(project.requests.count(("POST", "ruletags")), 1)
+        self.assertEqual(project.requests.count(("PATCH", "data/mentions")), 1)
+
+
+class TestBWQueriesValidInput(unittest.TestCase):
+    def test_special_options(self):
+        queries = BWQueries(StubBWProject())
+        self.assertTrue(queries._valid_input("pageType", "blog"))
+        self.assertTrue(queries._valid_input("pageType", ["blog", "forum"]))
+        self.assertFalse(queries._valid_input("pageType", ["not a page type"]))
+        # unhashable settings are rejected rather than raising
+        self.assertFalse(queries._valid_input("pageType", [["blog"]]))
+
+
+class TestBWQueriesListResources(unittest.TestCase):
+    def test_list_created_after_first_use(self):
+        project = RecordingStubBWProject()
+        project.examples["group/author/summary"] = {
+            "results": [{"id": 1, "name": "Old List"}]
+        }
+        queries = BWQueries(project)
+        self.assertEqual(queries._name_to_id("authorGroup", "Old List"), [1])
+
+        # e.g. created through a separate BWAuthorLists object
+        project.examples["group/author/summary"]["results"].append(
+            {"id": 2, "name": "New List"}
+        )
+        self.assertEqual(queries._name_to_id("authorGroup", "New List"), [2])
+        self.assertEqual(project.requests.count(("GET", "group/author/summary")), 2)
+
+        with self.assertRaises(KeyError):
+            queries._name_to_id("authorGroup", "Missing List")
+
+    def test_rule_list_created_after_first_use(self):
+        project = RecordingStubBWProject()
+        project.examples["rules"] = {"results": []}
+        project.examples["group/author/summary"] = {
+            "results": [{"id": 1, "name": "Old List"}]
+        }
+        rules = BWRules(project)
+        self.assertEqual(rules._id_to_name("authorGroup", [1]), "Old List")
+
+        project.examples["group/author/summary"]["results"].append(
+            {"id": 2, "name": "New List"}
+        )
+        self.assertEqual(rules._id_to_name("authorGroup", [2]), "New List")
+        self.assertEqual(project.requests.count(("GET", "group/author/summary")), 2)
+
+
+class TestBWCategoriesClearAll(unittest.TestCase):
+    def test_clear_all_in_project(self):
+        project = RecordingStubBWProject()
+        project.examples["rulecategories"] = {
+            "results": [
+                {"id": 1, "name": "Animals", "multiple": True, "children": []},
+                {"id": 2, "name": "Colours", "multiple": False, "children": []},
+            ]
+        }
+        categories = BWCategories(project)
+        project.requests.clear()
+
+        categories.clear_all_in_project()
+
+        self.assertEqual(
+            project.requests,
+            [
+                ("DELETE", "rulecategories/1"),
+                ("DELETE", "rulecategories/2"),
+                ("GET", "rulecategories"),
+            ],
+        )
+
+
+class TestBWGroupsDeepDelete(unittest.TestCase):
+    def test_deletes_query_added_after_load(self):
+        project = RecordingStubBWProject()
+        project.examples["querygroups"] = {"results": [{"id": 5, "name": "My Group"}]}
+        groups = BWGroups(project)
+
+        # e.g. added to the group in the UI after groups was created
+        project.examples["queries"]["results"].append({"id": 3, "name": "New Query"})
+        project.examples["querygroups/5"] = {
+            "queries": [
+                {"id": query_id, "name": "My Query"},
+                {"id": 3, "name": "New Query"},
+            ]
+        }
+        project.requests.clear()
+
+        groups.deep_delete("My Group")
+
+        self.assertIn(("DELETE", "queries/" + str(query_id)), project.requests)
+        self.assertIn(("DELETE", "queries/3"), project.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
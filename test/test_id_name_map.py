@@ -1,6 +1,8 @@
+import json
 import unittest
+from unittest import mock
 
-from bcr_api.bwresources import BWQueries
+from bcr_api.bwresources import AmbiguityError, BWQueries
 
 query_id = 1111111111
 
@@ -88,12 +90,11 @@ class TestBWQueriesCreation(unittest.TestCase):
     Used to run tests on BWQueries, using the real BWQueries class, but the stubbed version of BWProject
     """
 
-    def __init__(self, *args, **kwargs):
-        unittest.TestCase.__init__(
-            self, *args, **kwargs
-        )  # prevent this __init__ from overriding unittest testcase's original __init__
-        self.project = StubBWProject()
-        self.queries = self.test_create_queries()
+    @classmethod
+    def setUpClass(cls):
+        # the tests only read from these, so build them once rather than once per test
+        cls.project = StubBWProject()
+        cls.queries = BWQueries(cls.project)
 
     def test_create_queries(self):
         test_queries = BWQueries(self.project)
@@ -122,5 +123,50 @@ class TestBWQueriesCreation(unittest.TestCase):
         self.assertEqual(actual, expected)
 
 
+class TestBWQueriesAmbiguousName(unittest.TestCase):
+    def test_ambiguous_name_raises(self):
+        project = StubBWProject()
+        duplicate = dict(project.examples["queries"]["results"][0], id=query_id + 1)
+        project.examples["queries"]["results"].append(duplicate)
+        queries = BWQueries(project)
+        with self.assertRaises(AmbiguityError):
+            queries.get_resource_id("My Query")
+        self.assertEqual(queries.get_resource_id(query_id + 1), query_id + 1)
+        with self.assertRaises(AmbiguityError):
+            queries.check_resource_exists("My Query")
+
+    def test_check_resource_exists(self):
+        queries = BWQueries(StubBWProject())
+        self.assertTrue(queries.check_resource_exists("My Query"))
+        self.assertTrue(queries.check_resource_exists(query_id))
+        self.assertTrue(queries.check_resource_exists(str(query_id)))
+        self.assertFalse(queries.check_resource_exists("Missing Query"))
+        self.assertFalse(queries.check_resource_exists(query_id + 1))
+
+
+class TestBWQueriesValidateSearch(unittest.TestCase):
+    def setUp(self):
+        self.project = StubBWProject()
+        self.project.validate_query_search = mock.Mock()
+        self.queries = BWQueries(self.project)
+
+    def test_validates_by_default(self):
+        self.queries._fill_data({"name": "New Query", "booleanQuery": "cat AND dog"})
+        self.project.validate_query_search.assert_called_once_with(
+            booleanQuery="cat AND dog", language=["en"]
+        )
+
+    def test_skip_validation(self):
+        filled = self.queries._fill_data(
+            {
+                "name": "New Query",
+                "booleanQuery": "cat AND dog",
+                "validate_search": False,
+            }
+        )
+        self.project.validate_query_search.assert_not_called()
+        self.assertNotIn("validate_search", json.loads(filled))
+
+
 if __name__ == "__main__":
     unittest.main()
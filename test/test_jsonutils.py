@@ -0,0 +1,45 @@
+import json
+import unittest
+from unittest import mock
+
+from bcr_api import jsonutils
+
+
+class TestJsonUtils(unittest.TestCase):
+    def test_dumps_round_trip(self):
+        data = {"name": "My Query", "languages": ["en"], "samplePercentage": 100}
+        self.assertEqual(json.loads(jsonutils.dumps(data)), data)
+
+    def test_dumps_unicode(self):
+        data = {"booleanQuery": "café OR 猫"}
+        self.assertEqual(json.loads(jsonutils.dumps(data)), data)
+
+    def test_dumps_non_str_keys(self):
+        data = {1234: "My Category", 5678: "Other Category"}
+        self.assertEqual(
+            json.loads(jsonutils.dumps(data)), json.loads(json.dumps(data))
+        )
+
+    def test_loads_bytes(self):
+        body = '{"results": [{"id": 1, "name": "café"}]}'.encode("utf-8")
+        self.assertEqual(
+            jsonutils.loads(body), {"results": [{"id": 1, "name": "café"}]}
+        )
+
+    def test_loads_non_json(self):
+        for body in [b"", b"<html>Bad Gateway</html>"]:
+            with self.assertRaises(jsonutils.JSONDecodeError) as e:
+                jsonutils.loads(body)
+            self.assertEqual(e.exception.pos, 0)
+
+    def test_stdlib_fallback(self):
+        data = {"name": "My Query", "languages": ["en"]}
+        with mock.patch.object(jsonutils, "orjson", None):
+            self.assertEqual(jsonutils.loads(jsonutils.dumps(data).encode()), data)
+            with self.assertRaises(jsonutils.JSONDecodeError) as e:
+                jsonutils.loads(b"Not Found")
+            self.assertEqual(e.exception.pos, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()